@@ -10,17 +10,208 @@ Usage:
     Or set UBER_EATS_COOKIES environment variable:
     export UBER_EATS_COOKIES="jwt-session=xxx; uev2.loc=yyy"
     python uber-eats-scraper.py --city Edmonton --state AB
+
+    Scrape several cities concurrently (one "City, State" per line):
+    python uber-eats-scraper.py --cities cities.txt
 """
 
+import asyncio
 import json
 import base64
+import functools
+import gzip
 import urllib.parse
 import argparse
 from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
+import importlib.util
 import ssl
 import os
-from typing import Optional, Dict, Any
+import re
+import threading
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Tuple,
+    Union,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Only advertise brotli when it can be decoded (httpx/aiohttp use it too)
+ACCEPT_ENCODING = "gzip, br" if brotli is not None else "gzip"
+
+# Batch mode limits: concurrent feed requests, and retries on rate limiting
+MAX_CONCURRENT_REQUESTS = 20
+MAX_RETRIES = 3
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Network failures that batch mode retries, whichever client is in use;
+# certificate errors are excluded in fetch() since retrying can't fix them
+_TRANSIENT_ERRORS = (OSError, asyncio.TimeoutError)
+if aiohttp is not None:
+    _TRANSIENT_ERRORS += (aiohttp.ClientError,)
+if httpx is not None:
+    _TRANSIENT_ERRORS += (httpx.TransportError,)
+
+# Set by --quiet: progress output is dropped, errors and a summary remain
+QUIET = False
+
+# Container types parse_api_response may see, depending on the feed parser
+if simdjson is not None:
+    _OBJECT_TYPES = (dict, simdjson.Object)
+    _ARRAY_TYPES = (list, simdjson.Array)
+else:
+    _OBJECT_TYPES = (dict,)
+    _ARRAY_TYPES = (list,)
+
+
+if msgspec is not None:
+    # Just the parts of the getFeedV1 response the scraper reads; msgspec
+    # skips everything else while decoding.
+
+    class TitleMsg(msgspec.Struct):
+        text: Optional[str] = None
+
+    class RatingMsg(msgspec.Struct):
+        text: Optional[str] = None
+        ratingValue: Union[int, float, str, None] = None
+
+    class MetaMsg(msgspec.Struct):
+        text: Optional[str] = None
+        badgeType: Optional[str] = None
+
+    class StoreMsg(msgspec.Struct):
+        title: Union[TitleMsg, str, None] = None
+        actionUrl: Optional[str] = None
+        rating: Optional[RatingMsg] = None
+        priceBucket: Optional[str] = None
+        meta: List[MetaMsg] = []
+
+    class FeedItemMsg(msgspec.Struct):
+        type: Optional[str] = None
+        store: Optional[StoreMsg] = None
+        title: Any = None
+        subtitle: Any = None
+
+    class DataMsg(msgspec.Struct):
+        feedItems: List[FeedItemMsg] = []
+
+    class FeedMsg(msgspec.Struct):
+        data: Optional[DataMsg] = None
+
+
+def progress(message: str = "") -> None:
+    """Print a progress message, unless running with --quiet."""
+    if not QUIET:
+        print(message)
+
+
+def json_loads(data):
+    """Parse JSON from str or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode(
+        "utf-8"
+    )
+
+
+def decode_feed(body: bytes):
+    """Parse the API response with the fastest parser that is installed.
+
+    msgspec decodes straight into the FeedMsg structs; a response that
+    doesn't match that schema falls back to simdjson's lazy parse or
+    json_loads.
+    """
+    if msgspec is not None:
+        try:
+            return msgspec.json.decode(body, type=FeedMsg)
+        except msgspec.ValidationError:
+            pass
+
+    if simdjson is not None:
+        # Fresh parser per document: a parser can't be reused while proxies
+        # into its previous document are still alive.
+        return simdjson.Parser().parse(body)
+    return json_loads(body)
+
+
+def get_path(obj: Any, *keys: str, default: Any = None) -> Any:
+    """Look up a nested key path, returning default if any step is missing.
+
+    simdjson documents resolve the whole path in one JSON pointer lookup.
+    """
+    try:
+        if simdjson is not None and isinstance(obj, simdjson.Object):
+            return obj.at_pointer("/" + "/".join(keys))
+        for key in keys:
+            obj = obj[key]
+        return obj
+    except (KeyError, IndexError, TypeError, ValueError):
+        return default
+
+
+# Certificate-verifying context shared by every client, so the CA store
+# is loaded once (no client here passes session=, so TLS isn't resumed)
+_SSL_CONTEXT = ssl.create_default_context()
+
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def get_http_client():
+    """Return the shared keep-alive httpx client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        # Batch mode calls this from several threads at once
+        with _http_client_lock:
+            if _http_client is None:
+                # HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+                http2 = importlib.util.find_spec("h2") is not None
+                _http_client = httpx.Client(
+                    http2=http2, timeout=30, verify=_SSL_CONTEXT
+                )
+    return _http_client
 
 
 def build_api_url(city: str, state: str) -> str:
@@ -29,34 +220,54 @@ def build_api_url(city: str, state: str) -> str:
     return f"https://www.ubereats.com/_p/api/getFeedV1?localeCode=ca&city={city.lower()}&state={state_normalized}"
 
 
+PROVINCE_MAPPING = {
+    "ALBERTA": "AB",
+    "BRITISH COLUMBIA": "BC",
+    "MANITOBA": "MB",
+    "NEW BRUNSWICK": "NB",
+    "NEWFOUNDLAND": "NL",
+    "NOVA SCOTIA": "NS",
+    "ONTARIO": "ON",
+    "PRINCE EDWARD ISLAND": "PE",
+    "QUEBEC": "QC",
+    "SASKATCHEWAN": "SK",
+    "YUKON": "YT",
+    "NORTHWEST TERRITORIES": "NT",
+    "NUNAVUT": "NU",
+}
+
+
 def normalize_state(state: str) -> str:
     """Normalize state/province to 2-letter code."""
     state = state.strip().upper()
-
-    province_mapping = {
-        "ALBERTA": "AB",
-        "BRITISH COLUMBIA": "BC",
-        "MANITOBA": "MB",
-        "NEW BRUNSWICK": "NB",
-        "NEWFOUNDLAND": "NL",
-        "NOVA SCOTIA": "NS",
-        "ONTARIO": "ON",
-        "PRINCE EDWARD ISLAND": "PE",
-        "QUEBEC": "QC",
-        "SASKATCHEWAN": "SK",
-        "YUKON": "YT",
-        "NORTHWEST TERRITORIES": "NT",
-        "NUNAVUT": "NU",
-    }
-
-    return province_mapping.get(state, state[:2] if len(state) > 2 else state)
+    return PROVINCE_MAPPING.get(state, state[:2])
 
 
 def build_post_data(
-    cookies: Dict[str, str], city: str = "", state: str = ""
+    cookies: Dict[str, str],
+    city: str = "",
+    state: str = "",
+    use_cookie_location: bool = True,
 ) -> Dict[str, Any]:
-    """Build the POST request data using location from cookies."""
-    location_json = decode_uev2_loc(cookies.get("uev2.loc", ""))
+    """Build the POST request data using location from cookies.
+
+    With use_cookie_location off, the uev2.loc coordinates are ignored and
+    the cacheKey carries a "City, State" address instead, so each city in
+    a batch is looked up on its own rather than at the cookie's location.
+    """
+    encoded_loc = cookies.get("uev2.loc", "") if use_cookie_location else ""
+    cache_key = build_cache_key(encoded_loc, city, state)
+    return {"cacheKey": cache_key, "pageInfo": {"endTime": "0", "startTime": "0"}}
+
+
+@functools.lru_cache(maxsize=128)
+def build_cache_key(encoded_loc: str, city: str = "", state: str = "") -> str:
+    """Encode the feed cacheKey for a location cookie and city/state.
+
+    Memoized on its arguments, so a location repeated within a run (e.g. a
+    duplicate --cities line) is only encoded once.
+    """
+    location_json = decode_uev2_loc(encoded_loc)
 
     if (
         location_json
@@ -90,9 +301,7 @@ def build_post_data(
     }
 
     cache_key = base64.b64encode(json.dumps(cache_data).encode()).decode()
-    cache_key += f"/DELIVERY///0/0//[]///"
-
-    return {"cacheKey": cache_key, "pageInfo": {"endTime": "0", "startTime": "0"}}
+    return cache_key + "/DELIVERY///0/0//[]///"
 
 
 def decode_uev2_loc(encoded: str) -> Optional[Dict]:
@@ -100,23 +309,41 @@ def decode_uev2_loc(encoded: str) -> Optional[Dict]:
     if not encoded:
         return None
     try:
-        decoded = urllib.parse.unquote(encoded)
-        return json.loads(decoded)
+        # Skip the unquote copy when the cookie holds no %XX escapes
+        decoded = urllib.parse.unquote(encoded) if "%" in encoded else encoded
+        return json_loads(decoded)
     except (json.JSONDecodeError, TypeError) as e:
         print(f"⚠️  Could not decode uev2.loc: {e}")
         return None
 
 
-def make_api_request(
-    api_url: str, cookies: Dict[str, str], post_data: Dict[str, Any]
-) -> Optional[Dict]:
-    """Make the POST request to Uber Eats API."""
+def decompress(body: bytes, content_encoding: str) -> bytes:
+    """Undo a response's Content-Encoding (urllib doesn't do it for us)."""
+    encoding = content_encoding.strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "br" and brotli is not None:
+        return brotli.decompress(body)
+    return body
+
+
+def print_http_error(status: int, reason: str, api_url: str) -> None:
+    """Report a failed API call, with a hint for expired sessions."""
+    print(f"❌ HTTP Error {status}: {reason}")
+    print(f"   URL: {api_url}")
+    if status == 401:
+        print("   → Session cookies may have expired. Re-extract with Playwright.")
+
+
+def build_headers(cookies: Dict[str, str]) -> Dict[str, str]:
+    """Build the API request headers, including the session cookies."""
     cookie_string = "; ".join([f"{k}={v}" for k, v in cookies.items()])
 
-    headers = {
+    return {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
         "Accept": "application/json",
         "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": ACCEPT_ENCODING,
         "Content-Type": "application/json",
         "x-csrf-token": "x",
         "x-uber-client-gitref": "web-eats-v2",
@@ -125,24 +352,35 @@ def make_api_request(
         "Cookie": cookie_string,
     }
 
-    try:
-        data_bytes = json.dumps(post_data).encode("utf-8")
-        req = Request(api_url, data=data_bytes, headers=headers)
 
-        ssl_context = ssl.create_default_context()
-        ssl_context.check_hostname = False
-        ssl_context.verify_mode = ssl.CERT_NONE
+def post_feed(
+    api_url: str, headers: Dict[str, str], body: bytes
+) -> Tuple[int, str, bytes]:
+    """Send one feed POST with the blocking client.
 
-        with urlopen(req, context=ssl_context, timeout=30) as response:
-            response_data = response.read().decode("utf-8")
-            return json.loads(response_data)
+    Returns (status, reason, body); HTTP error statuses are returned rather
+    than raised, network failures raise.
+    """
+    if httpx is not None:
+        response = get_http_client().post(api_url, content=body, headers=headers)
+        return response.status_code, response.reason_phrase, response.content
 
+    req = Request(api_url, data=body, headers=headers)
+    try:
+        with urlopen(req, context=_SSL_CONTEXT, timeout=30) as response:
+            encoding = response.headers.get("Content-Encoding", "")
+            content = decompress(response.read(), encoding)
+            return response.status, response.reason, content
     except HTTPError as e:
-        print(f"❌ HTTP Error {e.code}: {e.reason}")
-        print(f"   URL: {api_url}")
-        if e.code == 401:
-            print("   → Session cookies may have expired. Re-extract with Playwright.")
-        return None
+        return e.code, e.reason, b""
+
+
+def make_api_request(
+    api_url: str, headers: Dict[str, str], post_data: Dict[str, Any]
+) -> Optional[bytes]:
+    """Make the POST request to Uber Eats API and return the raw JSON body."""
+    try:
+        status, reason, content = post_feed(api_url, headers, json_dumps(post_data))
     except URLError as e:
         print(f"❌ URL Error: {e.reason}")
         return None
@@ -150,36 +388,221 @@ def make_api_request(
         print(f"❌ Error making API request: {e}")
         return None
 
+    if status >= 400:
+        print_http_error(status, reason, api_url)
+        return None
+    return content
+
+
+async def aiohttp_post(
+    session: "aiohttp.ClientSession", api_url: str, body: bytes
+) -> Tuple[int, str, bytes]:
+    """Send one feed POST through aiohttp; returns (status, reason, body)."""
+    async with session.post(api_url, data=body) as response:
+        return response.status, response.reason or "", await response.read()
+
+
+def is_certificate_error(error: BaseException) -> bool:
+    """Whether a request failed TLS certificate verification.
+
+    Clients wrap the ssl error differently (URLError.reason, chained
+    exceptions, aiohttp's own class), so the whole chain is checked.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, ssl.SSLCertVerificationError):
+            return True
+        if aiohttp is not None and isinstance(
+            error, aiohttp.ClientConnectorCertificateError
+        ):
+            return True
+        reason = getattr(error, "reason", None)
+        if isinstance(reason, BaseException):
+            error = reason
+        else:
+            error = error.__cause__ or error.__context__
+    return False
+
+
+async def fetch(
+    send: Callable[[], Awaitable[Tuple[int, str, bytes]]],
+    api_url: str,
+    semaphore: asyncio.Semaphore,
+) -> Optional[bytes]:
+    """Run one feed request, backing off on rate limits and network errors.
+
+    send() makes a single attempt and returns (status, reason, body).
+    Returns the raw JSON body, or None if the request failed.
+    """
+    async with semaphore:
+        for attempt in range(MAX_RETRIES + 1):
+            retry = attempt < MAX_RETRIES
+            try:
+                status, reason, body = await send()
+            except _TRANSIENT_ERRORS as e:
+                if retry and not is_certificate_error(e):
+                    await asyncio.sleep(2**attempt)
+                    continue
+                print(f"❌ Error making API request: {e}")
+                return None
+
+            if status in RETRY_STATUSES and retry:
+                await asyncio.sleep(2**attempt)
+                continue
+            if status >= 400:
+                print_http_error(status, reason, api_url)
+                return None
+            return body
+
+
+async def scrape_cities(
+    locations: List[Tuple[str, str]], cookies: Dict[str, str]
+) -> List[Any]:
+    """Fetch the feeds for several (city, state) pairs concurrently.
+
+    Results are raw JSON bodies lined up with locations; a failed fetch
+    yields None or the raised exception.
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    # The Cookie header is prebuilt rather than handed to aiohttp's cookie
+    # jar, which would re-quote values such as the URL-encoded uev2.loc.
+    headers = build_headers(cookies)
+    requests = [
+        (
+            build_api_url(city, state),
+            json_dumps(
+                build_post_data(cookies, city, state, use_cookie_location=False)
+            ),
+        )
+        for city, state in locations
+    ]
+
+    if aiohttp is None:
+        # No aiohttp: run the blocking client in the default thread pool
+        loop = asyncio.get_running_loop()
+        tasks = [
+            fetch(
+                functools.partial(
+                    loop.run_in_executor, None, post_feed, api_url, headers, body
+                ),
+                api_url,
+                semaphore,
+            )
+            for api_url, body in requests
+        ]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    connector = aiohttp.TCPConnector(limit_per_host=64, ssl=_SSL_CONTEXT)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(
+        headers=headers, connector=connector, timeout=timeout
+    ) as session:
+        tasks = [
+            fetch(
+                functools.partial(aiohttp_post, session, api_url, body),
+                api_url,
+                semaphore,
+            )
+            for api_url, body in requests
+        ]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+class Store:
+    """A restaurant extracted from the feed, with its deals/savings."""
+
+    __slots__ = (
+        "name",
+        "delivery_time",
+        "delivery_cost",
+        "rating",
+        "price",
+        "badges",
+        "url",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        delivery_time: str,
+        delivery_cost: str,
+        rating: str,
+        price: str,
+        badges: List[str],
+        url: str,
+    ):
+        self.name = name
+        self.delivery_time = delivery_time
+        self.delivery_cost = delivery_cost
+        self.rating = rating
+        self.price = price
+        self.badges = badges
+        self.url = url
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the store's info in the output file format."""
+        return {
+            "Delivery Time": self.delivery_time,
+            "Delivery Cost": self.delivery_cost,
+            "Rating": self.rating,
+            "Price Range": self.price,
+            "Deals & Badges": self.badges,
+            "Store URL": self.url,
+        }
+
+
+def stores_to_dict(stores: List[Store]) -> Dict[str, List[Dict[str, Any]]]:
+    """Key stores by name in the output file format ({name: [info]})."""
+    return {store.name: [store.to_dict()] for store in stores}
+
 
-def parse_api_response(response: Dict) -> Dict[str, Any]:
+def parse_api_response(response: Any) -> List[Store]:
     """Parse the API response and extract restaurant data with deals/savings."""
-    restaurants = {}
+    if msgspec is not None and isinstance(response, FeedMsg):
+        return parse_feed_msg(response)
 
-    data = response.get("data", {})
-    feed_items = data.get("feedItems", [])
+    # Anything but {"data": {"feedItems": [...]}} has no stores to extract
+    data = response.get("data") if isinstance(response, _OBJECT_TYPES) else None
+    feed_items = data.get("feedItems") if isinstance(data, _OBJECT_TYPES) else None
+    if not isinstance(feed_items, _ARRAY_TYPES):
+        return []
 
     # Check for empty state
     for item in feed_items:
-        if item.get("type") == "EMPTY_STATE":
-            print(
-                f"⚠️  API returned empty state: {item.get('title', 'No businesses available')}"
+        if isinstance(item, _OBJECT_TYPES) and item.get("type") == "EMPTY_STATE":
+            print_empty_state(
+                item.get("title", "No businesses available"), item.get("subtitle", "")
             )
-            print(f"   Subtitle: {item.get('subtitle', '')}")
-            return {}
+            return []
+
+    return parse_stores(feed_items)
+
+
+def print_empty_state(title: Any, subtitle: Any) -> None:
+    """Report a feed that came back with no businesses."""
+    print(f"⚠️  API returned empty state: {title}")
+    print(f"   Subtitle: {subtitle}")
+
+
+def parse_stores(feed_items: Any) -> List[Store]:
+    """Extract the REGULAR_STORE entries from a list of feed items."""
+    # Keyed by name: chain locations share a title and the last one wins
+    stores = {}
 
     for item in feed_items:
-        if item.get("type") != "REGULAR_STORE":
+        if not isinstance(item, _OBJECT_TYPES) or item.get("type") != "REGULAR_STORE":
             continue
 
         store = item.get("store", {})
-        if not store:
+        if not store or not isinstance(store, _OBJECT_TYPES):
             continue
 
-        title_obj = store.get("title", {})
-        if isinstance(title_obj, dict):
-            store_name = title_obj.get("text", "")
-        else:
-            store_name = str(title_obj)
+        store_name = get_path(store, "title", "text")
+        if store_name is None:
+            # Some feed items carry the title as a plain string
+            title_obj = store.get("title")
+            store_name = title_obj if isinstance(title_obj, str) else ""
 
         if not store_name:
             continue
@@ -187,66 +610,104 @@ def parse_api_response(response: Dict) -> Dict[str, Any]:
         # Get store UUID for detailed lookups
         store_uuid = store.get("storeUuid", "")
 
-        info = {
-            "Delivery Time": "N/A",
-            "Delivery Cost": "N/A",
-            "Rating": "N/A",
-            "Price Range": "N/A",
-            "Deals & Badges": [],
-            "Store URL": "",
-        }
+        score = get_path(store, "rating", "text") or get_path(
+            store, "rating", "ratingValue"
+        )
 
-        # Extract store URL
-        action_url = store.get("actionUrl", "")
-        if action_url:
-            info["Store URL"] = f"https://www.ubereats.com{action_url}"
+        metadata = store.get("meta", [])
+        if not isinstance(metadata, _ARRAY_TYPES):
+            metadata = ()
+        meta = (
+            (entry.get("text", ""), entry.get("badgeType", ""))
+            for entry in metadata
+            if isinstance(entry, _OBJECT_TYPES)
+        )
 
-        # Extract rating
-        rating_info = store.get("rating", {})
-        if isinstance(rating_info, dict):
-            score = rating_info.get("text", rating_info.get("ratingValue", ""))
-            if score:
-                info["Rating"] = str(score)
+        stores[store_name] = build_store(
+            store_name,
+            store.get("actionUrl", ""),
+            score,
+            store.get("priceBucket", ""),
+            meta,
+        )
 
-        # Extract price range ($, $$, $$$)
-        price_bucket = store.get("priceBucket", "")
-        if price_bucket:
-            info["Price Range"] = price_bucket
+    return list(stores.values())
 
-        # Extract promotional badges and deals from metadata
-        metadata = store.get("meta", [])
-        badges = []
-        delivery_cost = "N/A"
 
-        if isinstance(metadata, list):
-            for meta in metadata:
-                if isinstance(meta, dict):
-                    text = meta.get("text", "")
-                    badge_type = meta.get("badgeType", "")
+def parse_feed_msg(feed: "FeedMsg") -> List[Store]:
+    """Extract stores from a feed decoded straight into msgspec structs."""
+    feed_items = feed.data.feedItems if feed.data else []
 
-                    # FARE badge = delivery fee (this is the key savings/deal info!)
-                    if badge_type == "FARE" and text:
-                        delivery_cost = text
+    # Check for empty state
+    for item in feed_items:
+        if item.type == "EMPTY_STATE":
+            title = item.title if item.title is not None else "No businesses available"
+            print_empty_state(title, item.subtitle or "")
+            return []
 
-                    if text:
-                        badges.append(text)
-                    if badge_type and badge_type not in [
-                        "ETD"
-                    ]:  # Skip ETD, already in delivery time
-                        badges.append(f"[{badge_type}]")
+    # Keyed by name, as in parse_stores
+    stores = {}
+    for item in feed_items:
+        store = item.store
+        if item.type != "REGULAR_STORE" or store is None:
+            continue
 
-            # Set delivery time from ETD badge
-            for meta in metadata:
-                if isinstance(meta, dict) and meta.get("badgeType") == "ETD":
-                    info["Delivery Time"] = meta.get("text", "N/A")
-                    break
+        title = store.title
+        store_name = title.text if isinstance(title, TitleMsg) else title
+        if not store_name:
+            continue
 
-        info["Delivery Cost"] = delivery_cost
-        info["Deals & Badges"] = [b for b in badges if b != "N/A"]
+        rating = store.rating
+        score = (rating.text or rating.ratingValue) if rating is not None else None
+        meta = ((entry.text or "", entry.badgeType or "") for entry in store.meta)
+
+        stores[store_name] = build_store(
+            store_name, store.actionUrl, score, store.priceBucket, meta
+        )
+
+    return list(stores.values())
+
+
+def build_store(
+    name: str,
+    action_url: Optional[str],
+    score: Any,
+    price_bucket: Optional[str],
+    meta: Iterable[Tuple[str, str]],
+) -> Store:
+    """Build a Store from raw feed fields; meta yields (text, badgeType) pairs."""
+    badges = []
+    delivery_cost = "N/A"
+    delivery_time = None
+
+    # Extract promotional badges and deals from metadata
+    for text, badge_type in meta:
+        # FARE badge = delivery fee (this is the key savings/deal info!)
+        if badge_type == "FARE" and text:
+            delivery_cost = text
+        # ETD badge = delivery time; the first one wins
+        elif badge_type == "ETD" and delivery_time is None:
+            delivery_time = text or "N/A"
+
+        if text:
+            badges.append(text)
+        if badge_type and badge_type != "ETD":  # ETD is in delivery time
+            badges.append(f"[{badge_type}]")
+
+    return Store(
+        name=name,
+        delivery_time=delivery_time or "N/A",
+        delivery_cost=delivery_cost,
+        rating=str(score) if score else "N/A",
+        # Price range is $, $$, $$$
+        price=price_bucket or "N/A",
+        badges=[b for b in badges if b != "N/A"],
+        url=f"https://www.ubereats.com{action_url}" if action_url else "",
+    )
 
-        restaurants[store_name] = [info]
 
-    return restaurants
+# name=value pairs of a Cookie header; values run up to the next ";"
+_COOKIE_RE = re.compile(r"([^=;\s]+)\s*=([^;]*)")
 
 
 def get_cookies_from_env() -> Optional[Dict[str, str]]:
@@ -255,18 +716,103 @@ def get_cookies_from_env() -> Optional[Dict[str, str]]:
     if not cookie_str:
         return None
 
-    cookies = {}
-    for part in cookie_str.split(";"):
-        part = part.strip()
-        if "=" in part:
-            key, value = part.split("=", 1)
-            cookies[key.strip()] = value.strip()
+    cookies = {
+        match.group(1): match.group(2).strip()
+        for match in _COOKIE_RE.finditer(cookie_str)
+    }
 
     if cookies:
-        print("✅ Using cookies from UBER_EATS_COOKIES environment variable")
+        progress("✅ Using cookies from UBER_EATS_COOKIES environment variable")
     return cookies if cookies else None
 
 
+def read_locations(path: str) -> List[Tuple[str, str]]:
+    """Read "City, State" lines from a file, skipping blanks and # comments."""
+    locations = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            city, sep, state = line.rpartition(",")
+            if not sep or not city.strip() or not state.strip():
+                print(f"⚠️  Skipping malformed location line: {line}")
+                continue
+            locations.append((city.strip(), state.strip()))
+    return locations
+
+
+def save_results(results: Any, output_file: str, by_location: bool = False) -> None:
+    """Write results as indented JSON, or one store per line for .jsonl files.
+
+    results is a list of stores, or {location: stores} when by_location is
+    set. JSONL lines keep the JSON nesting ({name: [info]}, prefixed by the
+    location in batch mode) so large scrapes never build one big buffer.
+    """
+    with open(output_file, "wb") as f:
+        if not output_file.endswith(".jsonl"):
+            if by_location:
+                output = {
+                    location: stores_to_dict(stores)
+                    for location, stores in results.items()
+                }
+            else:
+                output = stores_to_dict(results)
+            f.write(json_dumps(output, indent=True))
+            return
+
+        if by_location:
+            for location, stores in results.items():
+                for store in stores:
+                    record = {location: {store.name: [store.to_dict()]}}
+                    f.write(json_dumps(record) + b"\n")
+        else:
+            for store in results:
+                f.write(json_dumps({store.name: [store.to_dict()]}) + b"\n")
+
+
+def scrape_batch(
+    locations: List[Tuple[str, str]], cookies: Dict[str, str], output_file: str
+) -> None:
+    """Scrape several locations concurrently and save them keyed by location."""
+    progress(f"\n🌐 Fetching restaurant data for {len(locations)} locations...")
+    bodies = asyncio.run(scrape_cities(locations, cookies))
+
+    results = {}
+    for (city, state), body in zip(locations, bodies):
+        label = f"{city}, {state}"
+        if isinstance(body, BaseException):
+            print(f"❌ {label}: {body}")
+            continue
+        if not body:
+            print(f"❌ {label}: failed to fetch data")
+            continue
+
+        try:
+            restaurants = parse_api_response(decode_feed(body))
+        except ValueError as e:
+            print(f"❌ {label}: could not parse API response: {e}")
+            continue
+        if not restaurants:
+            print(f"⚠️  {label}: no restaurants found in API response")
+            continue
+
+        progress(f"✅ {label}: {len(restaurants)} restaurants")
+        results[label] = restaurants
+
+    if not results:
+        print("⚠️  No restaurants found for any location")
+        return
+
+    save_results(results, output_file, by_location=True)
+
+    total = sum(len(restaurants) for restaurants in results.values())
+    progress(f"💾 {total} restaurants from {len(results)} locations")
+    progress(f"   Results saved to {output_file}")
+    if QUIET:
+        print(f"{total} restaurants from {len(results)} locations -> {output_file}")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Uber Eats Scraper - Fetches restaurant data via internal API",
@@ -276,27 +822,52 @@ Examples:
   %(prog)s --city Edmonton --state AB
   %(prog)s --city Toronto --state ON
   UBER_EATS_COOKIES="jwt-session=xxx" %(prog)s --city Vancouver --state BC
+  %(prog)s --cities cities.txt
         """,
     )
-    parser.add_argument("--city", "-c", required=True, help="City name")
+    parser.add_argument("--city", "-c", help="City name")
     parser.add_argument(
         "--state",
         "-s",
-        required=True,
         help="State/province (full name or abbreviation)",
     )
+    parser.add_argument(
+        "--cities",
+        help='File with one "City, State" per line, fetched concurrently',
+    )
     parser.add_argument(
         "--output",
         "-o",
         default="final_result.json",
         help="Output file (default: final_result.json)",
     )
+    parser.add_argument(
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Only print errors and a final summary (for batch/log runs)",
+    )
 
     args = parser.parse_args()
 
-    print("🍕 Uber Eats Scraper - Direct API Mode")
-    print("=" * 50)
-    print(f"📍 Location: {args.city}, {args.state}")
+    global QUIET
+    QUIET = args.quiet
+
+    if args.cities:
+        locations = read_locations(args.cities)
+        if not locations:
+            parser.error(f"no locations found in {args.cities}")
+    elif args.city and args.state:
+        locations = [(args.city, args.state)]
+    else:
+        parser.error("either --cities or both --city and --state are required")
+
+    progress("🍕 Uber Eats Scraper - Direct API Mode")
+    progress("=" * 50)
+    if args.cities:
+        progress(f"📍 Locations: {len(locations)} from {args.cities}")
+    else:
+        progress(f"📍 Location: {args.city}, {args.state}")
 
     # Try to get cookies from environment
     cookies = get_cookies_from_env()
@@ -312,48 +883,61 @@ Examples:
         print("   4. Copy jwt-session and uev2.loc values")
         return
 
+    if args.cities:
+        scrape_batch(locations, cookies, args.output)
+        return
+
     # Build API request
     api_url = build_api_url(args.city, args.state)
     post_data = build_post_data(cookies, args.city, args.state)
 
-    print(f"\n🌐 Fetching restaurant data from Uber Eats API...")
-    print(f"   URL: {api_url}")
+    progress(f"\n🌐 Fetching restaurant data from Uber Eats API...")
+    progress(f"   URL: {api_url}")
 
     # Make API request
-    response = make_api_request(api_url, cookies, post_data)
+    body = make_api_request(api_url, build_headers(cookies), post_data)
 
-    if not response:
+    if not body:
         print("❌ Failed to fetch data from Uber Eats API")
         return
 
     # Parse response
-    print("📊 Parsing API response...")
-    restaurants = parse_api_response(response)
+    progress("📊 Parsing API response...")
+    try:
+        restaurants = parse_api_response(decode_feed(body))
+    except ValueError as e:
+        print(f"❌ Could not parse API response: {e}")
+        return
 
     if not restaurants:
         print("⚠️  No restaurants found in API response")
-        print("   Response keys:", list(response.keys()))
-        with open("debug_response.json", "w") as f:
-            json.dump(response, f, indent=2)
+        # Re-parse the raw body: the typed decoders only keep what they read
+        debug_response = json_loads(body)
+        if isinstance(debug_response, dict):
+            print("   Response keys:", list(debug_response.keys()))
+        with open("debug_response.json", "wb") as f:
+            f.write(json_dumps(debug_response, indent=True))
         print("   Saved full response to debug_response.json")
         return
 
-    print(f"✅ Found {len(restaurants)} restaurants")
+    progress(f"✅ Found {len(restaurants)} restaurants")
 
     # Save results
     output_file = args.output
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(restaurants, f, indent=2, ensure_ascii=False)
+    save_results(restaurants, output_file)
 
-    print(f"💾 Results saved to {output_file}")
+    progress(f"💾 Results saved to {output_file}")
+    if QUIET:
+        print(f"{len(restaurants)} restaurants -> {output_file}")
+        return
 
     # Show sample
-    print("\n📋 Sample results:")
-    for i, (name, info) in enumerate(list(restaurants.items())[:10]):
-        print(f"   • {name}: Rating {info[0]['Rating']}")
+    progress("\n📋 Sample results:")
+    for store in restaurants[:10]:
+        progress(f"   • {store.name}: Rating {store.rating}")
 
     if len(restaurants) > 10:
-        print(f"   ... and {len(restaurants) - 10} more")
+        progress(f"   ... and {len(restaurants) - 10} more")
 
 
 if __name__ == "__main__":